@@ -2,7 +2,7 @@
 
 import asyncio
 from enum import Enum
-from typing import Any
+from typing import Any, AsyncIterator
 
 import httpx
 from loguru import logger
@@ -451,6 +451,61 @@ class RAGFlowClient:
             logger.error(f"Error downloading from RAGFlow: {e}")
             return None
 
+    async def stream_document(
+        self,
+        dataset_id: str,
+        document_id: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream document content from RAGFlow without buffering the whole file.
+
+        Yields nothing if RAGFlow rejects the request; errors raised while
+        the body is being read are logged and re-raised so a partially
+        received file is never mistaken for a complete one.
+
+        Args:
+            dataset_id: Dataset ID
+            document_id: Document ID to download
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            Chunks of file content
+        """
+        url = f"{self.base_url}/api/v1/datasets/{dataset_id}/documents/{document_id}"
+
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with client.stream(
+                    "GET", url, headers=self._headers()
+                ) as response:
+                    if response.status_code != 200:
+                        logger.error(
+                            f"RAGFlow download failed for {document_id}: "
+                            f"HTTP {response.status_code}"
+                        )
+                        return
+
+                    # Check if response is JSON error
+                    content_type = response.headers.get("content-type", "")
+                    if "application/json" in content_type:
+                        await response.aread()
+                        data = response.json()
+                        if data.get("code") != 0:
+                            logger.error(
+                                f"RAGFlow download failed: {data.get('message')}"
+                            )
+                            return
+                        yield response.content
+                        return
+
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+
+        except Exception as e:
+            logger.error(f"Error downloading from RAGFlow: {e}")
+            raise
+
     async def upload_and_parse(
         self,
         dataset_id: str,
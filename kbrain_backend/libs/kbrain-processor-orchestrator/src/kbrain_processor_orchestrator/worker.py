@@ -1,6 +1,5 @@
 """Async worker for consuming RabbitMQ messages and processing documents."""
 
-import json
 from datetime import datetime
 from typing import Any
 
@@ -8,6 +7,7 @@ import httpx
 from aio_pika import connect_robust
 from aio_pika.abc import AbstractChannel, AbstractConnection, AbstractQueue
 from loguru import logger
+from pydantic import ValidationError
 
 from kbrain_processor_orchestrator.models import (
     DocumentInfo,
@@ -172,12 +172,12 @@ class ProcessingWorker:
             self._stats["last_message"] = datetime.utcnow()
 
             try:
-                # Parse message
-                body = message.body.decode()
-                logger.debug(f"Received message: {body}")
+                # Parse message straight from bytes with pydantic's JSON parser
+                logger.opt(lazy=True).debug(
+                    "Received message: {}", lambda: message.body.decode()
+                )
 
-                data = json.loads(body)
-                queue_msg = QueueMessage(**data)
+                queue_msg = QueueMessage.model_validate_json(message.body)
 
                 logger.info(
                     f"Received {queue_msg.action.value.upper()} for document "
@@ -190,8 +190,8 @@ class ProcessingWorker:
                 else:
                     await self._handle_add(queue_msg)
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in message: {e}")
+            except ValidationError as e:
+                logger.error(f"Invalid message: {e}")
                 self._increment_stat("total_failed")
                 # Ack message - invalid format, no point retrying
 
@@ -1,6 +1,6 @@
 """KBrain Storage - File storage abstraction library."""
 
-from kbrain_storage.base import BaseFileStorage
+from kbrain_storage.base import BaseFileStorage, StatResult
 from kbrain_storage.local import LocalFileStorage
 
-__all__ = ["BaseFileStorage", "LocalFileStorage"]
+__all__ = ["BaseFileStorage", "LocalFileStorage", "StatResult"]
@@ -4,8 +4,23 @@ Supports Local filesystem, AWS S3, and Azure Blob Storage.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+
+
+@dataclass(slots=True)
+class StatResult:
+    """
+    File metadata returned by BaseFileStorage.stat().
+
+    Attributes:
+        size: File size in bytes
+        mtime: Last modification time as a Unix timestamp, if known
+    """
+
+    size: int
+    mtime: Optional[float] = None
 
 
 class BaseFileStorage(ABC):
@@ -31,6 +46,29 @@ class BaseFileStorage(ABC):
         """
         pass
 
+    async def save_stream(
+        self,
+        path: Union[str, Path],
+        chunks: AsyncIterable[bytes],
+        overwrite: bool = True,
+    ) -> bool:
+        """
+        Save file to kbrain_storage from an async stream of chunks.
+
+        The default implementation buffers the chunks and delegates to
+        save_file; backends that can write incrementally should override it.
+
+        Args:
+            path: File path (relative to kbrain_storage root)
+            chunks: Async iterable yielding file content
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        content = b"".join([chunk async for chunk in chunks])
+        return await self.save_file(path, content, overwrite=overwrite)
+
     @abstractmethod
     async def read_file(self, path: Union[str, Path]) -> Optional[bytes]:
         """
@@ -44,6 +82,52 @@ class BaseFileStorage(ABC):
         """
         pass
 
+    async def read_file_into(
+        self, path: Union[str, Path], buffer: bytearray
+    ) -> Optional[int]:
+        """
+        Read file from kbrain_storage into a caller-supplied buffer.
+
+        Fills at most len(buffer) bytes. The default implementation copies
+        from read_file; backends that can read straight into the buffer
+        should override it.
+
+        Args:
+            path: File path (relative to kbrain_storage root)
+            buffer: Writable buffer to fill from the start of the file
+
+        Returns:
+            Number of bytes read, or None if file not found
+        """
+        content = await self.read_file(path)
+        if content is None:
+            return None
+        size = min(len(content), len(buffer))
+        buffer[:size] = content[:size]
+        return size
+
+    async def open_stream(
+        self, path: Union[str, Path], chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Read file from kbrain_storage as an async stream of chunks.
+
+        The default implementation reads the whole file with read_file;
+        backends that can read incrementally should override it.
+
+        Args:
+            path: File path (relative to kbrain_storage root)
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            File content chunks (nothing if the file is not found)
+        """
+        content = await self.read_file(path)
+        if content is None:
+            return
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     @abstractmethod
     async def exists(self, path: Union[str, Path]) -> bool:
         """
@@ -73,6 +157,35 @@ class BaseFileStorage(ABC):
         """
         pass
 
+    async def iter_directory(
+        self,
+        path: Union[str, Path] = "",
+        recursive: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over files in directory, optionally a page at a time.
+
+        The default implementation slices list_directory; backends that can
+        list incrementally should override it.
+
+        Args:
+            path: Directory path (empty string for root)
+            recursive: Whether to list recursively
+            offset: Number of files to skip
+            limit: Maximum number of files to yield (None for all)
+            batch_size: Hint for how many entries to fetch per backend call
+
+        Yields:
+            File paths (relative to kbrain_storage root)
+        """
+        files = await self.list_directory(path, recursive=recursive)
+        stop = None if limit is None else offset + limit
+        for file_path in files[offset:stop]:
+            yield file_path
+
     @abstractmethod
     async def delete_file(self, path: Union[str, Path]) -> bool:
         """
@@ -86,6 +199,25 @@ class BaseFileStorage(ABC):
         """
         pass
 
+    async def delete_files(self, paths: Iterable[Union[str, Path]]) -> int:
+        """
+        Delete several files from kbrain_storage.
+
+        The default implementation calls delete_file() once per path;
+        backends with a cheaper bulk operation should override it.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            Number of files that were deleted
+        """
+        deleted_count = 0
+        for path in dict.fromkeys(paths):
+            if await self.delete_file(path):
+                deleted_count += 1
+        return deleted_count
+
     @abstractmethod
     async def get_file_size(self, path: Union[str, Path]) -> Optional[int]:
         """
@@ -99,6 +231,39 @@ class BaseFileStorage(ABC):
         """
         pass
 
+    async def stat(self, path: Union[str, Path]) -> Optional[StatResult]:
+        """
+        Get file metadata in a single storage round-trip.
+
+        The default implementation only knows the size; backends that can
+        fetch more metadata in one call should override it.
+
+        Args:
+            path: File path
+
+        Returns:
+            StatResult, or None if file not found
+        """
+        size = await self.get_file_size(path)
+        if size is None:
+            return None
+        return StatResult(size=size)
+
+    def resolve_local_path(self, path: Union[str, Path]) -> Optional[Path]:
+        """
+        Get the absolute local filesystem path of a stored file.
+
+        Lets callers hand local files straight to the web server (e.g.
+        FileResponse) instead of streaming them through Python.
+
+        Args:
+            path: File path (relative to kbrain_storage root)
+
+        Returns:
+            Absolute path, or None if the backend does not store files locally
+        """
+        return None
+
     @abstractmethod
     async def create_directory(self, path: Union[str, Path]) -> bool:
         """
@@ -4,12 +4,177 @@ Uses pathlib for cross-platform file operations.
 """
 
 import asyncio
+import errno
+import itertools
+import os
+import re
+import shutil
+import stat as stat_module
+import uuid
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 import aiofiles
 import aiofiles.os
 
-from kbrain_storage.base import BaseFileStorage
+from kbrain_storage.base import BaseFileStorage, StatResult
+
+
+# Bytes per copy_file_range() call; the kernel caps a single call anyway
+_COPY_CHUNK = 1 << 30
+# copy_file_range() errors that mean "not supported here", e.g. across filesystems
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+# link() errors from filesystems without hard links (vfat/exFAT, CIFS, FUSE...)
+_NO_LINK_ERRNOS = {
+    errno.EPERM,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EMLINK,
+    errno.ENOSYS,
+}
+# Names produced by LocalFileStorage._temp_path, hidden from listings
+_TEMP_NAME = re.compile(r"\..+\.[0-9a-f]{32}\.tmp")
+
+
+def _resolve_under_root(root_path: Path, path: str) -> Optional[Path]:
+    """
+    Resolve path against root_path and check it stays inside.
+
+    The result is deliberately not cached: a component under the root may
+    be replaced by a symlink at any time, so containment is re-verified on
+    every call. Rejections return None rather than raising.
+
+    Returns:
+        Absolute path within root_path, or None if path is absolute or
+        escapes root_path
+    """
+    # Convert to Path and resolve
+    rel_path = Path(path)
+
+    # Prevent path traversal attacks
+    if rel_path.is_absolute():
+        return None
+
+    full_path = (root_path / rel_path).resolve()
+
+    # Ensure path is within root
+    if not full_path.is_relative_to(root_path):
+        return None
+
+    return full_path
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a whole file in one blocking call (run via asyncio.to_thread)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_into(path: Path, buffer: bytearray) -> int:
+    """Fill buffer from the start of a file without intermediate bytes (blocking)."""
+    view = memoryview(buffer)
+    total = 0
+    with open(path, "rb", buffering=0) as f:
+        while total < len(view):
+            count = f.readinto(view[total:])
+            if not count:
+                break
+            total += count
+    return total
+
+
+def _publish_exclusive(temp_path: Path, full_path: Path) -> bool:
+    """
+    Move temp_path to full_path only if full_path does not exist (blocking).
+
+    Uses os.link, which fails atomically if the target exists. Filesystems
+    without hard links instead claim the name with O_CREAT | O_EXCL and
+    then atomically replace the empty placeholder with the written file.
+
+    Returns:
+        True if published, False if full_path already exists
+    """
+    try:
+        os.link(temp_path, full_path)
+        return True
+    except FileExistsError:
+        return False
+    except OSError as e:
+        if e.errno not in _NO_LINK_ERRNOS:
+            raise
+
+    try:
+        fd = os.open(full_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    os.replace(temp_path, full_path)
+    return True
+
+
+def _write_and_replace(
+    temp_path: Path, full_path: Path, content: bytes, overwrite: bool = True
+) -> bool:
+    """
+    Write content to temp_path, then atomically move it to full_path (blocking).
+
+    With overwrite=False the file is published with _publish_exclusive, so
+    create-if-absent is atomic even against concurrent writers.
+
+    Returns:
+        True if written, False if full_path exists and overwrite is False
+    """
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        if overwrite:
+            os.replace(temp_path, full_path)
+            return True
+        return _publish_exclusive(temp_path, full_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _copy_and_replace(source: Path, temp_path: Path, destination: Path) -> None:
+    """Copy source to temp_path in the kernel, then move it over destination (blocking)."""
+    try:
+        with (
+            open(source, "rb", buffering=0) as src,
+            open(temp_path, "wb", buffering=0) as dst,
+        ):
+            if hasattr(os, "copy_file_range"):
+                try:
+                    while os.copy_file_range(src.fileno(), dst.fileno(), _COPY_CHUNK):
+                        pass
+                except OSError as e:
+                    if e.errno not in _COPY_FALLBACK_ERRNOS:
+                        raise
+            # Copies whatever copy_file_range did not (or all of it elsewhere)
+            shutil.copyfileobj(src, dst)
+        os.replace(temp_path, destination)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _unlink_files(paths: List[Path]) -> int:
+    """Unlink regular files, returning how many were removed."""
+    deleted_count = 0
+    for path in paths:
+        try:
+            path.unlink()
+            deleted_count += 1
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            continue
+        except Exception as e:
+            print(f"Error deleting file {path}: {e}")
+    return deleted_count
 
 
 class LocalFileStorage(BaseFileStorage):
@@ -26,7 +191,6 @@ class LocalFileStorage(BaseFileStorage):
             root_path: Root directory for file kbrain_storage
         """
         self.root_path = Path(root_path).resolve()
-        self._lock = asyncio.Lock()
 
         # Create root directory if it doesn't exist
         self.root_path.mkdir(parents=True, exist_ok=True)
@@ -44,22 +208,52 @@ class LocalFileStorage(BaseFileStorage):
         Raises:
             ValueError: If path tries to escape root directory
         """
-        # Convert to Path and resolve
-        rel_path = Path(path)
+        full_path = _resolve_under_root(self.root_path, str(path))
+        if full_path is None:
+            if Path(path).is_absolute():
+                raise ValueError("Path must be relative to kbrain_storage root")
+            raise ValueError(f"Path {path} is outside kbrain_storage root")
+        return full_path
+
+    def is_safe_path(self, path: Union[str, Path]) -> bool:
+        """
+        Check whether a path stays within the kbrain_storage root.
 
-        # Prevent path traversal attacks
-        if rel_path.is_absolute():
-            raise ValueError("Path must be relative to kbrain_storage root")
+        Lets callers reject unsafe paths up front without the ValueError
+        raised by the file operations.
 
-        full_path = (self.root_path / rel_path).resolve()
+        Args:
+            path: Relative path
 
-        # Ensure path is within root
-        try:
-            full_path.relative_to(self.root_path)
-        except ValueError:
-            raise ValueError(f"Path {path} is outside kbrain_storage root")
+        Returns:
+            True if path resolves inside kbrain_storage root, False otherwise
+        """
+        return _resolve_under_root(self.root_path, str(path)) is not None
 
-        return full_path
+    def resolve_local_path(self, path: Union[str, Path]) -> Optional[Path]:
+        """
+        Get the absolute local filesystem path of a stored file.
+
+        Args:
+            path: File path (relative to root)
+
+        Returns:
+            Absolute path within kbrain_storage root
+
+        Raises:
+            ValueError: If path is invalid or outside kbrain_storage root
+        """
+        return self._resolve_path(path)
+
+    @staticmethod
+    def _temp_path(full_path: Path) -> Path:
+        """
+        Get a unique temporary sibling path for writing full_path.
+
+        Files are written to the temporary path and then moved into place
+        with os.replace, so readers and crashes never see a partial file.
+        """
+        return full_path.with_name(f".{full_path.name}.{uuid.uuid4().hex}.tmp")
 
     async def save_file(
         self, path: Union[str, Path], content: bytes, overwrite: bool = True
@@ -67,6 +261,10 @@ class LocalFileStorage(BaseFileStorage):
         """
         Save file to local filesystem.
 
+        The file is written to a temporary sibling and atomically renamed
+        into place. With overwrite=False it is published only if the file
+        does not exist yet, atomically even against concurrent writers.
+
         Args:
             path: File path (relative to root)
             content: File content as bytes
@@ -82,16 +280,76 @@ class LocalFileStorage(BaseFileStorage):
         full_path = self._resolve_path(path)
 
         try:
-            # Check if file exists and overwrite is False
+            # Cheap fast-fail before writing the payload; the atomic check
+            # happens when the file is published
             if not overwrite and full_path.exists():
                 return False
 
             # Create parent directories
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file asynchronously
-            async with aiofiles.open(full_path, "wb") as f:
-                await f.write(content)
+            # Write and move into place with a single worker-thread hop
+            return await asyncio.to_thread(
+                _write_and_replace,
+                self._temp_path(full_path),
+                full_path,
+                content,
+                overwrite,
+            )
+        except Exception as e:
+            print(f"Error saving file {path}: {e}")
+            return False
+
+    async def save_stream(
+        self,
+        path: Union[str, Path],
+        chunks: AsyncIterable[bytes],
+        overwrite: bool = True,
+    ) -> bool:
+        """
+        Save file to local filesystem chunk by chunk.
+
+        Only one chunk is held in memory at a time. Chunks go to a temporary
+        sibling that is atomically renamed into place once the stream ends,
+        so a stream failing midway leaves any existing file untouched.
+
+        Args:
+            path: File path (relative to root)
+            chunks: Async iterable yielding file content
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            True if successful, False otherwise
+
+        Raises:
+            ValueError: If path is invalid or outside kbrain_storage root
+        """
+        # This will raise ValueError if path is invalid
+        full_path = self._resolve_path(path)
+
+        try:
+            # Cheap fast-fail before streaming the payload; the atomic check
+            # happens when the file is published
+            if not overwrite and full_path.exists():
+                return False
+
+            # Create parent directories
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_path = self._temp_path(full_path)
+            try:
+                async with aiofiles.open(temp_path, "wb") as f:
+                    async for chunk in chunks:
+                        await f.write(chunk)
+                if overwrite:
+                    await aiofiles.os.replace(temp_path, full_path)
+                elif not await asyncio.to_thread(
+                    _publish_exclusive, temp_path, full_path
+                ):
+                    # Created by someone else while the stream was written
+                    return False
+            finally:
+                temp_path.unlink(missing_ok=True)
 
             return True
         except Exception as e:
@@ -110,16 +368,65 @@ class LocalFileStorage(BaseFileStorage):
         """
         try:
             full_path = self._resolve_path(path)
+            return await asyncio.to_thread(_read_bytes, full_path)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+        except Exception as e:
+            print(f"Error reading file {path}: {e}")
+            return None
+
+    async def read_file_into(
+        self, path: Union[str, Path], buffer: bytearray
+    ) -> Optional[int]:
+        """
+        Read file from local filesystem directly into a caller-supplied buffer.
 
-            if not full_path.exists() or not full_path.is_file():
-                return None
+        Args:
+            path: File path (relative to root)
+            buffer: Writable buffer to fill from the start of the file
 
-            async with aiofiles.open(full_path, "rb") as f:
-                return await f.read()
+        Returns:
+            Number of bytes read, or None if not found
+        """
+        try:
+            full_path = self._resolve_path(path)
+            return await asyncio.to_thread(_read_into, full_path, buffer)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
         except Exception as e:
             print(f"Error reading file {path}: {e}")
             return None
 
+    async def open_stream(
+        self, path: Union[str, Path], chunk_size: int = 1024 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Read file from local filesystem chunk by chunk.
+
+        Args:
+            path: File path (relative to root)
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            File content chunks (nothing if the file is not found)
+        """
+        try:
+            full_path = self._resolve_path(path)
+
+            # Let open() report a missing file instead of stat()-ing first
+            try:
+                f = await aiofiles.open(full_path, "rb")
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                return
+
+            try:
+                while chunk := await f.read(chunk_size):
+                    yield chunk
+            finally:
+                await f.close()
+        except Exception as e:
+            print(f"Error reading file {path}: {e}")
+
     async def exists(self, path: Union[str, Path]) -> bool:
         """
         Check if file or directory exists.
@@ -136,6 +443,48 @@ class LocalFileStorage(BaseFileStorage):
         except Exception:
             return False
 
+    def _resolve_directory(self, path: Union[str, Path]) -> Optional[Path]:
+        """
+        Resolve a directory path, returning None if it is not a directory.
+
+        Raises:
+            ValueError: If path is invalid or outside kbrain_storage root
+        """
+        full_path = self.root_path if path == "" else self._resolve_path(path)
+        if not full_path.is_dir():
+            return None
+        return full_path
+
+    def _scan_files(self, directory: Path, recursive: bool) -> Iterator[str]:
+        """
+        Yield file paths under a directory using os.scandir.
+
+        Temporary files left by in-flight or interrupted writes are skipped.
+
+        Blocking; run it in a worker thread.
+
+        Args:
+            directory: Absolute directory path within root
+            recursive: Whether to descend into subdirectories
+
+        Yields:
+            File paths relative to kbrain_storage root, in directory order
+        """
+        # Entries are built by joining onto the (resolved) directory, so the
+        # root prefix can be sliced off instead of calling os.path.relpath
+        prefix_len = len(os.path.join(self.root_path, ""))
+        pending = [str(directory)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if _TEMP_NAME.fullmatch(entry.name):
+                        # In-flight or orphaned write, not a stored file
+                        continue
+                    if entry.is_file():
+                        yield entry.path[prefix_len:]
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+
     async def list_directory(
         self, path: Union[str, Path] = "", recursive: bool = False
     ) -> List[str]:
@@ -150,36 +499,60 @@ class LocalFileStorage(BaseFileStorage):
             List of file paths (relative to kbrain_storage root)
         """
         try:
-            if path == "":
-                full_path = self.root_path
-            else:
-                full_path = self._resolve_path(path)
-
-            if not full_path.exists() or not full_path.is_dir():
+            full_path = self._resolve_directory(path)
+            if full_path is None:
                 return []
 
-            files = []
-
-            if recursive:
-                # Recursive listing
-                for item in full_path.rglob("*"):
-                    if item.is_file():
-                        # Get path relative to root
-                        rel_path = item.relative_to(self.root_path)
-                        files.append(str(rel_path))
-            else:
-                # Non-recursive listing
-                for item in full_path.iterdir():
-                    if item.is_file():
-                        # Get path relative to root
-                        rel_path = item.relative_to(self.root_path)
-                        files.append(str(rel_path))
-
-            return sorted(files)
+            return await asyncio.to_thread(
+                lambda: sorted(self._scan_files(full_path, recursive))
+            )
         except Exception as e:
             print(f"Error listing directory {path}: {e}")
             return []
 
+    async def iter_directory(
+        self,
+        path: Union[str, Path] = "",
+        recursive: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over files in directory without building the full listing.
+
+        The directory is scanned in a worker thread, batch_size entries at a
+        time, so memory stays bounded by the batch rather than the directory.
+
+        Args:
+            path: Directory path (empty string for root)
+            recursive: Whether to list recursively
+            offset: Number of files to skip
+            limit: Maximum number of files to yield (None for all)
+            batch_size: Number of entries scanned per worker-thread call
+
+        Yields:
+            File paths (relative to kbrain_storage root), in directory order
+        """
+        try:
+            full_path = self._resolve_directory(path)
+        except Exception as e:
+            print(f"Error listing directory {path}: {e}")
+            return
+        if full_path is None:
+            return
+
+        stop = None if limit is None else offset + limit
+        files = itertools.islice(self._scan_files(full_path, recursive), offset, stop)
+        try:
+            while batch := await asyncio.to_thread(
+                list, itertools.islice(files, batch_size)
+            ):
+                for file_path in batch:
+                    yield file_path
+        except Exception as e:
+            print(f"Error listing directory {path}: {e}")
+
     async def delete_file(self, path: Union[str, Path]) -> bool:
         """
         Delete file from local filesystem.
@@ -193,15 +566,36 @@ class LocalFileStorage(BaseFileStorage):
         try:
             full_path = self._resolve_path(path)
 
-            if not full_path.exists() or not full_path.is_file():
+            # A single unlink; missing files and directories are reported by it
+            try:
+                await aiofiles.os.remove(full_path)
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
                 return False
-
-            await aiofiles.os.remove(str(full_path))
             return True
         except Exception as e:
             print(f"Error deleting file {path}: {e}")
             return False
 
+    async def delete_files(self, paths: Iterable[Union[str, Path]]) -> int:
+        """
+        Delete several files from local filesystem in one worker thread.
+
+        Args:
+            paths: File paths
+
+        Returns:
+            Number of files that were deleted
+        """
+        unique_paths = list(dict.fromkeys(paths))
+        full_paths = []
+        for path in unique_paths:
+            try:
+                full_paths.append(self._resolve_path(path))
+            except ValueError as e:
+                print(f"Error deleting file {path}: {e}")
+
+        return await asyncio.to_thread(_unlink_files, full_paths)
+
     async def get_file_size(self, path: Union[str, Path]) -> Optional[int]:
         """
         Get file size in bytes.
@@ -212,17 +606,31 @@ class LocalFileStorage(BaseFileStorage):
         Returns:
             File size in bytes, or None if not found
         """
-        try:
-            full_path = self._resolve_path(path)
+        result = await self.stat(path)
+        return result.size if result is not None else None
 
-            if not full_path.exists() or not full_path.is_file():
-                return None
+    async def stat(self, path: Union[str, Path]) -> Optional[StatResult]:
+        """
+        Get file metadata with a single stat() call.
 
-            stat = await aiofiles.os.stat(str(full_path))
-            return stat.st_size
+        Args:
+            path: File path
+
+        Returns:
+            StatResult, or None if not found or not a regular file
+        """
+        try:
+            full_path = self._resolve_path(path)
+            st = await asyncio.to_thread(os.stat, full_path)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            print(f"Error getting file size {path}: {e}")
+            print(f"Error getting file stat {path}: {e}")
+            return None
+
+        if not stat_module.S_ISREG(st.st_mode):
             return None
+        return StatResult(size=st.st_size, mtime=st.st_mtime)
 
     async def create_directory(self, path: Union[str, Path]) -> bool:
         """
@@ -236,7 +644,7 @@ class LocalFileStorage(BaseFileStorage):
         """
         try:
             full_path = self._resolve_path(path)
-            full_path.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.makedirs(full_path, exist_ok=True)
             return True
         except Exception as e:
             print(f"Error creating directory {path}: {e}")
@@ -258,17 +666,15 @@ class LocalFileStorage(BaseFileStorage):
         try:
             full_path = self._resolve_path(path)
 
-            if not full_path.exists() or not full_path.is_dir():
+            if not await aiofiles.os.path.isdir(full_path):
                 return False
 
             if recursive:
                 # Delete directory and all contents
-                import shutil
-
-                shutil.rmtree(full_path)
+                await asyncio.to_thread(shutil.rmtree, full_path)
             else:
                 # Delete only if empty
-                full_path.rmdir()
+                await aiofiles.os.rmdir(full_path)
 
             return True
         except Exception as e:
@@ -281,6 +687,10 @@ class LocalFileStorage(BaseFileStorage):
         """
         Copy file within kbrain_storage.
 
+        The data is copied by the kernel (copy_file_range, which can reflink
+        on btrfs/xfs) without passing through Python memory, and the copy is
+        renamed into place atomically.
+
         Args:
             source: Source file path
             destination: Destination file path
@@ -289,11 +699,21 @@ class LocalFileStorage(BaseFileStorage):
             True if successful
         """
         try:
-            content = await self.read_file(source)
-            if content is None:
+            source_path = self._resolve_path(source)
+            destination_path = self._resolve_path(destination)
+
+            if not source_path.is_file():
                 return False
 
-            return await self.save_file(destination, content, overwrite=True)
+            destination_path.parent.mkdir(parents=True, exist_ok=True)
+
+            await asyncio.to_thread(
+                _copy_and_replace,
+                source_path,
+                self._temp_path(destination_path),
+                destination_path,
+            )
+            return True
         except Exception as e:
             print(f"Error copying file {source} to {destination}: {e}")
             return False
@@ -0,0 +1,133 @@
+"""
+io_uring-backed local filesystem kbrain_storage implementation (Linux only).
+Requires: async-fs (the "uring" extra)
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Optional, Union
+
+import aiofiles.os
+
+from kbrain_storage.local import LocalFileStorage, _publish_exclusive
+
+
+class UringLocalFileStorage(LocalFileStorage):
+    """
+    Local filesystem kbrain_storage using io_uring for file I/O.
+
+    Reads, writes and deletes are submitted to the kernel through io_uring
+    instead of being dispatched to a thread pool. Path handling and the
+    remaining operations are inherited from LocalFileStorage.
+
+    Installation:
+        pip install "kbrain-storage[uring]"
+
+    Example:
+        kbrain_storage = UringLocalFileStorage(root_path="storage_data")
+    """
+
+    def __init__(self, root_path: Union[str, Path] = "storage_data"):
+        """
+        Initialize io_uring file kbrain_storage.
+
+        Args:
+            root_path: Root directory for file kbrain_storage
+
+        Raises:
+            ImportError: If async-fs is not installed
+        """
+        import async_fs
+
+        self._fs = async_fs
+        super().__init__(root_path=root_path)
+
+    async def save_file(
+        self, path: Union[str, Path], content: bytes, overwrite: bool = True
+    ) -> bool:
+        """
+        Save file to local filesystem via io_uring.
+
+        The file is written to a temporary sibling and atomically renamed
+        into place; with overwrite=False an existing file is never replaced.
+
+        Args:
+            path: File path (relative to root)
+            content: File content as bytes
+            overwrite: Whether to overwrite existing file
+
+        Returns:
+            True if successful, False otherwise
+
+        Raises:
+            ValueError: If path is invalid or outside kbrain_storage root
+        """
+        # This will raise ValueError if path is invalid
+        full_path = self._resolve_path(path)
+
+        try:
+            # Cheap fast-fail before writing the payload; the atomic check
+            # happens when the file is published
+            if not overwrite and full_path.exists():
+                return False
+
+            # Create parent directories
+            full_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_path = self._temp_path(full_path)
+            try:
+                await self._fs.write_file(str(temp_path), content)
+                if overwrite:
+                    await aiofiles.os.replace(temp_path, full_path)
+                    return True
+                return await asyncio.to_thread(_publish_exclusive, temp_path, full_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
+        except Exception as e:
+            print(f"Error saving file {path}: {e}")
+            return False
+
+    async def read_file(self, path: Union[str, Path]) -> Optional[bytes]:
+        """
+        Read file from local filesystem via io_uring.
+
+        Args:
+            path: File path (relative to root)
+
+        Returns:
+            File content as bytes, or None if file not found
+        """
+        try:
+            full_path = self._resolve_path(path)
+
+            # is_file() is False for missing paths too: one stat, not two
+            if not full_path.is_file():
+                return None
+
+            data: bytes = await self._fs.read_file(str(full_path))
+            return data
+        except Exception as e:
+            print(f"Error reading file {path}: {e}")
+            return None
+
+    async def delete_file(self, path: Union[str, Path]) -> bool:
+        """
+        Delete file from local filesystem via io_uring.
+
+        Args:
+            path: File path
+
+        Returns:
+            True if deleted, False if not found
+        """
+        try:
+            full_path = self._resolve_path(path)
+
+            if not full_path.is_file():
+                return False
+
+            await self._fs.delete_file(str(full_path))
+            return True
+        except Exception as e:
+            print(f"Error deleting file {path}: {e}")
+            return False
@@ -0,0 +1,33 @@
+"""Add (tag_id, document_id) index to document_tags
+
+Revision ID: add_document_tags_tag_index
+Revises: add_processing_result
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "add_document_tags_tag_index"
+down_revision: Union[str, Sequence[str], None] = "add_processing_result"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index document_tags by tag for reverse (documents of a tag) lookups."""
+    op.create_index(
+        "ix_document_tags_tag_document",
+        "document_tags",
+        ["tag_id", "document_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the reverse lookup index from document_tags."""
+    op.drop_index("ix_document_tags_tag_document", table_name="document_tags")
@@ -0,0 +1,61 @@
+"""ASGI middleware."""
+
+import re
+
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from kbrain_backend.utils.http import ORJSONResponse
+
+# Single-document upload route (POST /v1/scopes/{scope_id}/documents)
+UPLOAD_PATH = re.compile(r"/v1/scopes/[^/]+/documents$")
+
+# Allowance for multipart boundaries, part headers and the other form fields
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized document uploads from their Content-Length header.
+
+    FastAPI parses the whole multipart body before the route runs, so the
+    size check in the upload handler only happens after the upload has been
+    received. This middleware answers 413 before any of the body is read.
+    Requests without a (truthful) Content-Length are still caught by the
+    handler's own byte counting.
+    """
+
+    def __init__(self, app: ASGIApp, max_file_size: int) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            max_file_size: Maximum allowed file size in bytes
+        """
+        self.app = app
+        self.max_file_size = max_file_size
+        self.max_body_size = max_file_size + MULTIPART_OVERHEAD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and UPLOAD_PATH.search(scope["path"])
+        ):
+            content_length = Headers(scope=scope).get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_body_size:
+                response = ORJSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={
+                        "error": {
+                            "code": "FILE_TOO_LARGE",
+                            "message": f"File size exceeds maximum allowed size of {self.max_file_size} bytes",
+                        }
+                    },
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
@@ -1,10 +1,11 @@
 """Document API routes."""
 
+import asyncio
 import hashlib
-import mimetypes
-from datetime import datetime
-from pathlib import Path
-from typing import Optional, cast
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, cast
 from uuid import UUID, uuid4
 
 from fastapi import (
@@ -12,17 +13,23 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
+    Response,
     UploadFile,
     File,
     Form,
     status,
 )
-from fastapi.responses import StreamingResponse
-from sqlalchemy import select, func
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy import select, insert, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from kbrain_backend.api.schemas import (
+    DocumentList,
+    BatchUploadResponse,
+    BatchUploadResult,
     DocumentResponse,
     DocumentListResponse,
     DocumentUploadResponse,
@@ -35,10 +42,18 @@ from kbrain_backend.api.schemas import (
 )
 from kbrain_backend.core.models.scope import Scope
 from kbrain_backend.core.models.document import Document
-from kbrain_backend.core.models.tag import Tag
+from kbrain_backend.core.models.tag import Tag, document_tags
 from kbrain_backend.database.connection import get_db
 from kbrain_backend.config.settings import settings
 from kbrain_backend.utils.logger import logger
+from kbrain_backend.utils.http import (
+    etag_matches,
+    http_date,
+    make_etag,
+    not_modified,
+    not_modified_since,
+)
+from kbrain_backend.utils.mime import guess_mime_type
 from kbrain_backend.api.routes.processing import get_publisher
 
 # We'll use the storage from main.py, for now we'll import it
@@ -47,6 +62,9 @@ from kbrain_storage import BaseFileStorage
 
 router = APIRouter(tags=["documents"])
 
+# Uploads are streamed to storage in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 # Placeholder for storage - will be injected
 _storage: Optional[BaseFileStorage] = None
@@ -79,7 +97,7 @@ async def list_documents(
     order: str = Query("desc", pattern="^(asc|desc)$"),
     search: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
-) -> DocumentListResponse:
+) -> Response:
     """List documents in a scope."""
     # Verify scope exists
     scope_query = select(Scope).where(Scope.id == scope_id)
@@ -90,10 +108,11 @@ async def list_documents(
             detail={"error": {"code": "NOT_FOUND", "message": "Scope not found"}},
         )
 
-    # Build query
+    # Build query; processing results can be large and are only returned by
+    # the detail endpoint, so the list leaves that column unloaded
     query = (
         select(Document)
-        .options(selectinload(Document.tags))
+        .options(selectinload(Document.tags), defer(Document.processing_result))
         .where(Document.scope_id == scope_id)
     )
 
@@ -122,6 +141,9 @@ async def list_documents(
     # Execute query
     result = await db.execute(query)
     documents = result.scalars().all()
+    for document in documents:
+        # Keep the field in the payload as null without a lazy load per row
+        set_committed_value(document, "processing_result", None)
 
     # Pagination metadata
     total_items_count = total_items or 0
@@ -137,46 +159,16 @@ async def list_documents(
         has_prev=page > 1,
     )
 
-    # Convert documents to response objects with tags
-    document_responses = []
-    for doc in documents:
-        tag_responses = [
-            TagResponse(
-                id=cast(UUID, tag.id),
-                scope_id=cast(UUID, tag.scope_id),
-                name=tag.name,
-                description=tag.description,
-                color=tag.color,
-                meta=tag.meta,
-                created_at=tag.created_at,
-                updated_at=tag.updated_at,
-            )
-            for tag in doc.tags
-        ]
-
-        doc_response = DocumentResponse(
-            id=cast(UUID, doc.id),
-            scope_id=cast(UUID, doc.scope_id),
-            filename=doc.filename,
-            original_name=doc.original_name,
-            file_size=doc.file_size,
-            mime_type=doc.mime_type,
-            file_extension=doc.file_extension,
-            storage_path=doc.storage_path,
-            storage_backend=doc.storage_backend,
-            status=doc.status,
-            upload_date=doc.upload_date,
-            processing_started=doc.processing_started,
-            processed_at=doc.processed_at,
-            error_message=doc.error_message,
-            metadata=doc.doc_metadata,
-            tags=tag_responses,
-            created_at=doc.created_at,
-            updated_at=doc.updated_at,
-        )
-        document_responses.append(doc_response)
-
-    return DocumentListResponse(documents=document_responses, pagination=pagination)
+    # Validate the whole page (documents and their tags) in one pass and
+    # serialize it directly, skipping FastAPI's per-item re-validation
+    response = DocumentListResponse(
+        documents=DocumentList.validate_python(documents, from_attributes=True),
+        pagination=pagination,
+    )
+    return Response(
+        content=response.model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/v1/documents/{document_id}", response_model=DocumentDetailResponse)
@@ -206,8 +198,8 @@ async def get_document(
     # Convert tags to TagResponse objects
     tag_responses = [
         TagResponse(
-            id=cast(UUID, tag.id),
-            scope_id=cast(UUID, tag.scope_id),
+            id=tag.id,
+            scope_id=tag.scope_id,
             name=tag.name,
             description=tag.description,
             color=tag.color,
@@ -219,8 +211,8 @@ async def get_document(
     ]
 
     response = DocumentDetailResponse(
-        id=cast(UUID, document.id),
-        scope_id=cast(UUID, document.scope_id),
+        id=document.id,
+        scope_id=document.scope_id,
         scope_name=scope.name if scope else None,
         filename=document.filename,
         original_name=document.original_name,
@@ -246,110 +238,166 @@ async def get_document(
     return response
 
 
-@router.post(
-    "/v1/scopes/{scope_id}/documents",
-    response_model=DocumentUploadResponse,
-    status_code=status.HTTP_201_CREATED,
-)
-async def upload_document(
-    scope_id: UUID,
-    file: UploadFile = File(...),
-    tag_ids: Optional[str] = Form(None),  # Comma-separated tag IDs from form data
-    auto_process: bool = Form(True),  # Automatically queue for processing
-    db: AsyncSession = Depends(get_db),
-    storage: BaseFileStorage = Depends(get_storage),
-) -> DocumentUploadResponse:
-    """Upload a new document to a scope with optional tags and auto-processing."""
-    # Verify scope exists
-    scope_query = select(Scope).where(Scope.id == scope_id)
-    scope = await db.scalar(scope_query)
+@dataclass(slots=True)
+class _StoredUpload:
+    """An upload written to storage, with its size and checksums."""
 
-    if not scope:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": {"code": "NOT_FOUND", "message": "Scope not found"}},
-        )
+    filename: str
+    storage_path: str
+    file_size: int
+    md5_hash: str
+    sha256_hash: str
 
-    # Get file extension
-    file_ext = Path(file.filename).suffix.lstrip(".").lower() if file.filename else ""
 
-    # Validate file extension
-    if file_ext not in scope.allowed_extensions:
+def _file_extension(file: UploadFile) -> str:
+    """Get the lowercase extension of an uploaded file, without the dot."""
+    if not file.filename:
+        return ""
+    # Clients may send Windows-style names; normalise before parsing
+    return PurePosixPath(file.filename.replace("\\", "/")).suffix.lstrip(".").lower()
+
+
+def _ensure_safe_path(path: PurePosixPath) -> None:
+    """
+    Reject storage paths that are absolute or contain '..' segments.
+
+    Raises:
+        HTTPException: If the path could escape its intended directory
+    """
+    if path.is_absolute() or ".." in path.parts:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "error": {
                     "code": "VALIDATION_ERROR",
-                    "message": "Invalid file extension",
-                    "details": [
-                        {
-                            "field": "file",
-                            "message": f"File extension '{file_ext}' not allowed in this scope. Allowed: {', '.join(scope.allowed_extensions)}",
-                        }
-                    ],
+                    "message": f"Invalid storage path: {path}",
                 }
             },
         )
 
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
 
-    # Check file size
-    if file_size > settings.max_file_size:
+async def _load_tags(
+    db: AsyncSession, scope_id: UUID, tag_ids: Optional[str]
+) -> List[Tag]:
+    """
+    Parse comma-separated tag IDs and load the tags.
+
+    Args:
+        db: Database session
+        scope_id: Scope the tags must belong to
+        tag_ids: Comma-separated tag IDs (duplicates collapse to one)
+
+    Returns:
+        Loaded tags
+
+    Raises:
+        HTTPException: If an ID is malformed, a tag is missing or belongs to another scope
+    """
+    if not tag_ids:
+        return []
+
+    try:
+        unique_tag_ids = {
+            UUID(tid.strip()) for tid in tag_ids.split(",") if tid.strip()
+        }
+    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "error": {
-                    "code": "FILE_TOO_LARGE",
-                    "message": f"File size exceeds maximum allowed size of {settings.max_file_size} bytes",
+                    "code": "VALIDATION_ERROR",
+                    "message": "Invalid tag ID format",
                 }
             },
         )
 
-    # Generate unique filename
-    unique_filename = (
-        f"{datetime.now().strftime('%Y-%m-%d')}_{uuid4().hex[:12]}.{file_ext}"
-    )
-
-    # Generate storage path (scope-based)
-    storage_path = f"scopes/{scope.name}/{datetime.now().year}/{datetime.now().month:02d}/{unique_filename}"
+    if not unique_tag_ids:
+        return []
 
-    # Calculate checksums
-    md5_hash = hashlib.md5(content).hexdigest()
-    sha256_hash = hashlib.sha256(content).hexdigest()
+    # Fetch tags and validate they belong to the same scope
+    tags_query = select(Tag).where(Tag.id.in_(unique_tag_ids))
+    tags_result = await db.execute(tags_query)
+    tags = list(tags_result.scalars().all())
 
-    # Check for duplicate file in this scope (by SHA256 checksum)
-    duplicate_query = select(Document).where(
-        Document.scope_id == scope_id, Document.checksum_sha256 == sha256_hash
-    )
-    duplicate = await db.scalar(duplicate_query)
+    # Check all tags exist
+    if len(tags) != len(unique_tag_ids):
+        found_ids = {tag.id for tag in tags}
+        missing_ids = unique_tag_ids - found_ids
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": f"Tags not found: {', '.join(str(tid) for tid in missing_ids)}",
+                }
+            },
+        )
 
-    if duplicate:
+    # Check all tags belong to the same scope
+    invalid_tags = [tag for tag in tags if tag.scope_id != scope_id]
+    if invalid_tags:
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "error": {
-                    "code": "DUPLICATE_FILE",
-                    "message": f"This file already exists in the scope (duplicate of '{duplicate.original_name}')",
-                    "details": [
-                        {
-                            "field": "file",
-                            "message": f"File with identical content already exists: {duplicate.original_name}",
-                        }
-                    ],
+                    "code": "VALIDATION_ERROR",
+                    "message": "Tags do not belong to the specified scope",
                 }
             },
         )
 
-    # Get MIME type
-    mime_type, _ = mimetypes.guess_type(file.filename or "")
+    return tags
+
+
+async def _store_upload(
+    storage: BaseFileStorage, scope: Scope, file: UploadFile, file_ext: str
+) -> _StoredUpload:
+    """
+    Stream an upload to storage, computing size and checksums on the fly.
+
+    Args:
+        storage: Storage backend
+        scope: Target scope (used for the storage path)
+        file: Uploaded file
+        file_ext: Validated file extension
+
+    Returns:
+        Stored upload details
+
+    Raises:
+        HTTPException: If saving fails or the file exceeds the size limit
+    """
+    # Generate unique filename
+    now = datetime.now()
+    unique_filename = f"{now.strftime('%Y-%m-%d')}_{uuid4().hex[:12]}.{file_ext}"
+
+    # Generate storage path (scope-based)
+    path = PurePosixPath(
+        "scopes", scope.name, str(now.year), f"{now.month:02d}", unique_filename
+    )
+    _ensure_safe_path(path)
+    storage_path = str(path)
+
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+    file_size = 0
+
+    async def read_chunks() -> AsyncIterator[bytes]:
+        nonlocal file_size
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            file_size += len(chunk)
+            if file_size > settings.max_file_size:
+                # Stop early; the truncated file is removed below
+                return
+            md5.update(chunk)
+            sha256.update(chunk)
+            yield chunk
 
     # Save file to storage
     try:
-        success = await storage.save_file(storage_path, content)
+        success = await storage.save_stream(storage_path, read_chunks())
         if not success:
-            logger.error(f"Failed to save file to storage: {storage_path}")
+            logger.error("Failed to save file to storage: {}", storage_path)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
@@ -362,109 +410,77 @@ async def upload_document(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error saving file to storage: {storage_path}")
+        logger.exception("Error saving file to storage: {}", storage_path)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": {"code": "STORAGE_ERROR", "message": str(e)}},
         )
 
-    # Create document record
-    document = Document(
-        scope_id=scope_id,
+    # Check file size
+    if file_size > settings.max_file_size:
+        await storage.delete_file(storage_path)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": {
+                    "code": "FILE_TOO_LARGE",
+                    "message": f"File size exceeds maximum allowed size of {settings.max_file_size} bytes",
+                }
+            },
+        )
+
+    return _StoredUpload(
         filename=unique_filename,
-        original_name=file.filename,
+        storage_path=storage_path,
         file_size=file_size,
-        mime_type=mime_type,
+        md5_hash=md5.hexdigest(),
+        sha256_hash=sha256.hexdigest(),
+    )
+
+
+def _new_document(
+    scope: Scope, file: UploadFile, file_ext: str, upload: _StoredUpload
+) -> Document:
+    """Build the document record for a stored upload."""
+    return Document(
+        scope_id=scope.id,
+        filename=upload.filename,
+        original_name=file.filename,
+        file_size=upload.file_size,
+        mime_type=guess_mime_type(file.filename or ""),
         file_extension=file_ext,
-        storage_path=storage_path,
+        storage_path=upload.storage_path,
         storage_backend=scope.storage_backend,
-        checksum_md5=md5_hash,
-        checksum_sha256=sha256_hash,
+        checksum_md5=upload.md5_hash,
+        checksum_sha256=upload.sha256_hash,
         status="added",
         upload_date=datetime.utcnow(),
     )
 
-    db.add(document)
 
-    # Parse and validate tag_ids if provided
-    if tag_ids:
-        tag_id_list = []
-        try:
-            # Parse comma-separated UUIDs
-            tag_id_list = [
-                UUID(tid.strip()) for tid in tag_ids.split(",") if tid.strip()
-            ]
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "error": {
-                        "code": "VALIDATION_ERROR",
-                        "message": "Invalid tag ID format",
-                    }
-                },
-            )
-
-        if tag_id_list:
-            # Fetch tags and validate they belong to the same scope
-            tags_query = select(Tag).where(Tag.id.in_(tag_id_list))
-            tags_result = await db.execute(tags_query)
-            tags = tags_result.scalars().all()
-
-            # Check all tags exist
-            if len(tags) != len(tag_id_list):
-                found_ids = {cast(UUID, tag.id) for tag in tags}
-                missing_ids = set(tag_id_list) - found_ids
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={
-                        "error": {
-                            "code": "NOT_FOUND",
-                            "message": f"Tags not found: {', '.join(str(tid) for tid in missing_ids)}",
-                        }
-                    },
-                )
-
-            # Check all tags belong to the same scope
-            invalid_tags = [tag for tag in tags if tag.scope_id != scope_id]
-            if invalid_tags:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail={
-                        "error": {
-                            "code": "VALIDATION_ERROR",
-                            "message": "Tags do not belong to the specified scope",
-                        }
-                    },
-                )
-
-            # Assign tags to document
-            document.tags = list(tags)
-
-    await db.commit()
-    await db.refresh(document, attribute_names=["tags"])
+async def _queue_for_processing(document_id: UUID, scope_id: UUID) -> None:
+    """Queue an uploaded document for processing, if processing is enabled."""
+    try:
+        publisher = get_publisher()
+        await publisher.publish_document(
+            document_id=document_id,
+            scope_id=scope_id,
+        )
+        logger.info("Queued document {} for processing", document_id)
+    except HTTPException:
+        # Publisher not initialized (processing disabled) - skip
+        logger.debug("Processing disabled, skipping auto-queue")
+    except Exception as e:
+        # Log error but don't fail the upload
+        logger.warning("Failed to queue document for processing: {}", e)
 
-    # Queue document for processing if auto_process is enabled
-    if auto_process:
-        try:
-            publisher = get_publisher()
-            await publisher.publish_document(
-                document_id=document.id,
-                scope_id=scope_id,
-            )
-            logger.info(f"Queued document {document.id} for processing")
-        except HTTPException:
-            # Publisher not initialized (processing disabled) - skip
-            logger.debug("Processing disabled, skipping auto-queue")
-        except Exception as e:
-            # Log error but don't fail the upload
-            logger.warning(f"Failed to queue document for processing: {e}")
 
-    # Convert tags to TagResponse objects
+def _upload_response(document: Document, tags: List[Tag]) -> DocumentUploadResponse:
+    """Build the upload response for a newly created document."""
     tag_responses = [
         TagResponse(
-            id=cast(UUID, tag.id),
-            scope_id=cast(UUID, tag.scope_id),
+            id=tag.id,
+            scope_id=tag.scope_id,
             name=tag.name,
             description=tag.description,
             color=tag.color,
@@ -472,12 +488,12 @@ async def upload_document(
             created_at=tag.created_at,
             updated_at=tag.updated_at,
         )
-        for tag in document.tags
+        for tag in tags
     ]
 
     return DocumentUploadResponse(
-        id=cast(UUID, document.id),
-        scope_id=cast(UUID, document.scope_id),
+        id=document.id,
+        scope_id=document.scope_id,
         filename=document.filename,
         original_name=document.original_name,
         file_size=document.file_size,
@@ -493,6 +509,247 @@ async def upload_document(
     )
 
 
+def _batch_error(filename: str, code: str, message: str) -> BatchUploadResult:
+    """Build a failed batch upload result."""
+    return BatchUploadResult(
+        filename=filename,
+        status="error",
+        error={"code": code, "message": message},
+    )
+
+
+@router.post(
+    "/v1/scopes/{scope_id}/documents",
+    response_model=DocumentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_document(
+    scope_id: UUID,
+    file: UploadFile = File(...),
+    tag_ids: Optional[str] = Form(None),  # Comma-separated tag IDs from form data
+    auto_process: bool = Form(True),  # Automatically queue for processing
+    db: AsyncSession = Depends(get_db),
+    storage: BaseFileStorage = Depends(get_storage),
+) -> DocumentUploadResponse:
+    """Upload a new document to a scope with optional tags and auto-processing."""
+    # Verify scope exists
+    scope_query = select(Scope).where(Scope.id == scope_id)
+    scope = await db.scalar(scope_query)
+
+    if not scope:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "NOT_FOUND", "message": "Scope not found"}},
+        )
+
+    # Get file extension
+    file_ext = _file_extension(file)
+
+    # Validate file extension
+    if file_ext not in scope.allowed_extensions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": "Invalid file extension",
+                    "details": [
+                        {
+                            "field": "file",
+                            "message": f"File extension '{file_ext}' not allowed in this scope. Allowed: {', '.join(scope.allowed_extensions)}",
+                        }
+                    ],
+                }
+            },
+        )
+
+    # Validate tags before touching the file, so invalid requests don't pay
+    # for reading, hashing and storing the upload
+    tags = await _load_tags(db, scope_id, tag_ids)
+
+    upload = await _store_upload(storage, scope, file, file_ext)
+
+    # Check for duplicate file in this scope (by SHA256 checksum)
+    duplicate_query = select(Document).where(
+        Document.scope_id == scope_id, Document.checksum_sha256 == upload.sha256_hash
+    )
+    duplicate = await db.scalar(duplicate_query)
+
+    if duplicate:
+        await storage.delete_file(upload.storage_path)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "error": {
+                    "code": "DUPLICATE_FILE",
+                    "message": f"This file already exists in the scope (duplicate of '{duplicate.original_name}')",
+                    "details": [
+                        {
+                            "field": "file",
+                            "message": f"File with identical content already exists: {duplicate.original_name}",
+                        }
+                    ],
+                }
+            },
+        )
+
+    # Create document record
+    document = _new_document(scope, file, file_ext, upload)
+
+    try:
+        db.add(document)
+        await db.flush()
+
+        # Assign tags with one multi-row INSERT into the association table; the
+        # validated tags are reused for the response instead of reloading them
+        if tags:
+            await db.execute(
+                insert(document_tags),
+                [{"document_id": document.id, "tag_id": tag.id} for tag in tags],
+            )
+
+        await db.commit()
+    except Exception:
+        # The record was not saved, so don't leave the stored file orphaned
+        await storage.delete_file(upload.storage_path)
+        raise
+
+    # Queue document for processing if auto_process is enabled
+    if auto_process:
+        await _queue_for_processing(document.id, scope_id)
+
+    return _upload_response(document, tags)
+
+
+@router.post(
+    "/v1/scopes/{scope_id}/documents/batch",
+    response_model=BatchUploadResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+)
+async def upload_documents_batch(
+    scope_id: UUID,
+    files: List[UploadFile] = File(..., alias="files[]"),
+    tag_ids: Optional[str] = Form(None),  # Comma-separated tag IDs from form data
+    auto_process: bool = Form(True),  # Automatically queue for processing
+    db: AsyncSession = Depends(get_db),
+    storage: BaseFileStorage = Depends(get_storage),
+) -> BatchUploadResponse:
+    """Upload multiple documents to a scope, writing them to storage concurrently."""
+    # Verify scope exists
+    scope_query = select(Scope).where(Scope.id == scope_id)
+    scope = await db.scalar(scope_query)
+
+    if not scope:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "NOT_FOUND", "message": "Scope not found"}},
+        )
+
+    tags = await _load_tags(db, scope_id, tag_ids)
+
+    results: List[Optional[BatchUploadResult]] = [None] * len(files)
+    uploads: Dict[int, _StoredUpload] = {}
+
+    async def store_one(index: int, file: UploadFile) -> None:
+        filename = file.filename or ""
+        file_ext = _file_extension(file)
+        if file_ext not in scope.allowed_extensions:
+            results[index] = _batch_error(
+                filename,
+                "VALIDATION_ERROR",
+                f"File extension '{file_ext}' not allowed in this scope. Allowed: {', '.join(scope.allowed_extensions)}",
+            )
+            return
+        try:
+            uploads[index] = await _store_upload(storage, scope, file, file_ext)
+        except HTTPException as e:
+            error = cast(Dict[str, Any], e.detail)["error"]
+            results[index] = _batch_error(filename, error["code"], error["message"])
+        except Exception as e:
+            logger.exception("Error storing batch upload: {}", filename)
+            results[index] = _batch_error(filename, "STORAGE_ERROR", str(e))
+
+    # Storage writes overlap; each task records its own outcome, so one
+    # failing file doesn't cancel the others
+    async with asyncio.TaskGroup() as tg:
+        for index, file in enumerate(files):
+            tg.create_task(store_one(index, file))
+
+    # Database work is sequential since the session can't be shared between tasks
+    created: List[Tuple[int, Document]] = []
+    seen_checksums: Dict[str, str] = {}
+    try:
+        for index, upload in sorted(uploads.items()):
+            file = files[index]
+            filename = file.filename or ""
+
+            # Duplicates are checked against the scope and earlier files in the batch
+            duplicate_name: Optional[str]
+            if upload.sha256_hash in seen_checksums:
+                duplicate_name = seen_checksums[upload.sha256_hash]
+            else:
+                duplicate_name = await db.scalar(
+                    select(Document.original_name).where(
+                        Document.scope_id == scope_id,
+                        Document.checksum_sha256 == upload.sha256_hash,
+                    )
+                )
+
+            if duplicate_name is not None:
+                await storage.delete_file(upload.storage_path)
+                results[index] = _batch_error(
+                    filename,
+                    "DUPLICATE_FILE",
+                    f"This file already exists in the scope (duplicate of '{duplicate_name}')",
+                )
+                continue
+
+            seen_checksums[upload.sha256_hash] = filename
+            document = _new_document(scope, file, _file_extension(file), upload)
+            db.add(document)
+            created.append((index, document))
+
+        if created:
+            await db.flush()
+
+            if tags:
+                await db.execute(
+                    insert(document_tags),
+                    [
+                        {"document_id": document.id, "tag_id": tag.id}
+                        for _, document in created
+                        for tag in tags
+                    ],
+                )
+
+            await db.commit()
+    except Exception:
+        # No record was saved, so don't leave the stored files orphaned
+        await storage.delete_files(upload.storage_path for upload in uploads.values())
+        raise
+
+    for index, document in created:
+        if auto_process:
+            await _queue_for_processing(document.id, scope_id)
+        results[index] = BatchUploadResult(
+            filename=files[index].filename or "",
+            status="success",
+            document=_upload_response(document, tags),
+        )
+
+    batch_results = [cast(BatchUploadResult, result) for result in results]
+    successful = sum(1 for result in batch_results if result.status == "success")
+
+    return BatchUploadResponse(
+        results=batch_results,
+        summary={
+            "total": len(batch_results),
+            "successful": successful,
+            "failed": len(batch_results) - successful,
+        },
+    )
+
+
 @router.get("/v1/documents/{document_id}/download", response_model=DownloadUrlResponse)
 async def get_download_url(
     document_id: UUID,
@@ -525,9 +782,10 @@ async def get_download_url(
 @router.get("/v1/documents/{document_id}/content")
 async def download_document_content(
     document_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     storage: BaseFileStorage = Depends(get_storage),
-) -> StreamingResponse:
+) -> Response:
     """Directly download document content (proxy download)."""
     query = select(Document).where(Document.id == document_id)
     result = await db.execute(query)
@@ -539,12 +797,14 @@ async def download_document_content(
             detail={"error": {"code": "NOT_FOUND", "message": "Document not found"}},
         )
 
-    # Read file from storage
+    # Check file in storage; its size also gives the Content-Length
     try:
-        content = await storage.read_file(document.storage_path)
-        if content is None:
+        file_stat = await storage.stat(document.storage_path)
+        if file_stat is None:
             logger.warning(
-                f"File not found in storage for document {document_id}: {document.storage_path}"
+                "File not found in storage for document {}: {}",
+                document_id,
+                document.storage_path,
             )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -559,20 +819,45 @@ async def download_document_content(
         raise
     except Exception as e:
         logger.exception(
-            f"Error reading file from storage for document {document_id}: {document.storage_path}"
+            "Error reading file from storage for document {}: {}",
+            document_id,
+            document.storage_path,
         )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": {"code": "STORAGE_ERROR", "message": str(e)}},
         )
 
-    # Return file as streaming response
+    # Conditional request handling
+    etag = make_etag(document.checksum_sha256, file_stat.size, file_stat.mtime)
+    modified_at = (
+        datetime.fromtimestamp(file_stat.mtime, tz=timezone.utc)
+        if file_stat.mtime is not None
+        else document.updated_at
+    )
+    last_modified = http_date(modified_at)
+    if etag_matches(request, etag) or not_modified_since(request, modified_at):
+        return not_modified(etag, last_modified)
+
+    # Local files are served by the web server directly
+    local_path = storage.resolve_local_path(document.storage_path)
+    if local_path is not None:
+        return FileResponse(
+            local_path,
+            media_type=document.mime_type or "application/octet-stream",
+            filename=document.original_name,
+            headers={"ETag": etag, "Last-Modified": last_modified},
+        )
+
+    # Stream file from storage without buffering it in memory
     return StreamingResponse(
-        iter([content]),
+        storage.open_stream(document.storage_path),
         media_type=document.mime_type or "application/octet-stream",
         headers={
             "Content-Disposition": f'attachment; filename="{document.original_name}"',
-            "Content-Length": str(document.file_size),
+            "Content-Length": str(file_stat.size),
+            "ETag": etag,
+            "Last-Modified": last_modified,
         },
     )
 
@@ -618,7 +903,7 @@ async def delete_document(
             await storage.delete_file(document.storage_path)
         except Exception as e:
             # Log error but continue with database deletion
-            logger.warning(f"Failed to delete file from storage: {e}")
+            logger.warning("Failed to delete file from storage: {}", e)
 
     # Delete from database
     await db.delete(document)
@@ -635,13 +920,13 @@ async def delete_document(
             original_name=doc_original_name,
             ragflow_document_id=ragflow_document_id,
         )
-        logger.info(f"Published delete notification for document {document_id}")
+        logger.info("Published delete notification for document {}", document_id)
     except HTTPException:
         # Publisher not initialized (processing disabled) - skip notification
         logger.debug("Processing disabled, skipping delete notification")
     except Exception as e:
         # Log error but don't fail the deletion
-        logger.warning(f"Failed to publish delete notification: {e}")
+        logger.warning("Failed to publish delete notification: {}", e)
 
     return None
 
@@ -697,6 +982,7 @@ async def update_document_status(
         UNIQUE_TAGS = {"xlsx_z_lekami"}
         doc_tag_names = {tag.name for tag in document.tags}
         matching_unique = doc_tag_names & UNIQUE_TAGS
+        replaced_docs: List[Document] = []
 
         for tag_name in matching_unique:
             old_docs_query = (
@@ -713,14 +999,20 @@ async def update_document_status(
 
             for old_doc in old_docs:
                 logger.info(
-                    f"Removing old document '{old_doc.original_name}' "
-                    f"(replaced by '{document.original_name}', tag '{tag_name}')"
+                    "Removing old document '{}' (replaced by '{}', tag '{}')",
+                    old_doc.original_name,
+                    document.original_name,
+                    tag_name,
                 )
-                try:
-                    storage = get_storage()
-                    await storage.delete_file(old_doc.storage_path)
-                except Exception as e:
-                    logger.warning(f"Failed to delete old file from storage: {e}")
+                replaced_docs.append(old_doc)
+
+        if replaced_docs:
+            try:
+                storage = get_storage()
+                await storage.delete_files(doc.storage_path for doc in replaced_docs)
+            except Exception as e:
+                logger.warning("Failed to delete old files from storage: {}", e)
+            for old_doc in dict.fromkeys(replaced_docs):
                 await db.delete(old_doc)
 
     await db.commit()
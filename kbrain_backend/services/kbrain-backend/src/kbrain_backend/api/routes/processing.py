@@ -1,9 +1,8 @@
 """Document processing routes."""
 
 import hashlib
-import mimetypes
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -16,6 +15,7 @@ from kbrain_backend.core.models.document import Document
 from kbrain_backend.core.models.scope import Scope
 from kbrain_backend.database.connection import get_db
 from kbrain_backend.utils.logger import logger
+from kbrain_backend.utils.mime import guess_mime_type
 from kbrain_processor_orchestrator import RAGFlowClient
 
 # Router for processing endpoints
@@ -129,7 +129,7 @@ async def queue_document_for_processing(
         scope_id=request.scope_id,
     )
 
-    logger.info(f"Queued document {request.document_id} for processing")
+    logger.info("Queued document {} for processing", request.document_id)
 
     return QueueDocumentResponse(
         message="Document queued for processing",
@@ -170,7 +170,7 @@ async def queue_document_by_id(
         scope_id=UUID(str(document.scope_id)),
     )
 
-    logger.info(f"Queued document {document_id} for processing")
+    logger.info("Queued document {} for processing", document_id)
 
     return QueueDocumentResponse(
         message="Document queued for processing",
@@ -346,6 +346,9 @@ async def sync_from_ragflow(
             detail="RAGFlow dataset ID is not configured (missing RAGFLOW_DATASET_ID)",
         )
 
+    # Narrowed local: the check above does not carry into nested functions
+    dataset_id: str = settings.ragflow_dataset_id
+
     # Validate scope exists
     scope_query = select(Scope).where(Scope.id == scope_id)
     scope_result = await db.execute(scope_query)
@@ -360,8 +363,8 @@ async def sync_from_ragflow(
         api_key=settings.ragflow_api_key,
     )
 
-    ragflow_docs = await client.list_all_documents(dataset_id=settings.ragflow_dataset_id)
-    logger.info(f"Found {len(ragflow_docs)} documents in RAGFlow dataset")
+    ragflow_docs = await client.list_all_documents(dataset_id=dataset_id)
+    logger.info("Found {} documents in RAGFlow dataset", len(ragflow_docs))
 
     # Get existing documents with ragflow_document_id
     existing_query = select(Document).where(Document.scope_id == scope_id)
@@ -407,17 +410,6 @@ async def sync_from_ragflow(
 
         # Download file from RAGFlow and store locally
         try:
-            # Download file content
-            file_bytes = await client.download_document(
-                dataset_id=settings.ragflow_dataset_id,
-                document_id=ragflow_doc.id,
-            )
-
-            if not file_bytes:
-                logger.error(f"Failed to download {ragflow_doc.name} from RAGFlow")
-                failed += 1
-                continue
-
             # Extract file extension from name
             name_parts = ragflow_doc.name.rsplit(".", 1)
             file_ext = name_parts[1].lower() if len(name_parts) > 1 else ""
@@ -431,28 +423,50 @@ async def sync_from_ragflow(
                 f"{datetime.now().month:02d}/{unique_filename}"
             )
 
-            # Save to local storage (lazy import to avoid circular dependency)
+            md5 = hashlib.md5()
+            sha256 = hashlib.sha256()
+            file_size = 0
+
+            async def download_chunks() -> AsyncIterator[bytes]:
+                nonlocal file_size
+                async for chunk in client.stream_document(
+                    dataset_id=dataset_id,
+                    document_id=ragflow_doc.id,
+                ):
+                    file_size += len(chunk)
+                    md5.update(chunk)
+                    sha256.update(chunk)
+                    yield chunk
+
+            # Stream file from RAGFlow into local storage
+            # (lazy import to avoid circular dependency)
             from kbrain_backend.api.routes.documents import get_storage
             storage = get_storage()
-            success = await storage.save_file(storage_path, file_bytes)
+            success = await storage.save_stream(storage_path, download_chunks())
             if not success:
-                logger.error(f"Failed to save {ragflow_doc.name} to storage")
+                logger.error("Failed to save {} to storage", ragflow_doc.name)
+                failed += 1
+                continue
+
+            if file_size == 0:
+                logger.error("Failed to download {} from RAGFlow", ragflow_doc.name)
+                await storage.delete_file(storage_path)
                 failed += 1
                 continue
 
             # Calculate checksums
-            md5_hash = hashlib.md5(file_bytes).hexdigest()
-            sha256_hash = hashlib.sha256(file_bytes).hexdigest()
+            md5_hash = md5.hexdigest()
+            sha256_hash = sha256.hexdigest()
 
             # Detect MIME type
-            mime_type, _ = mimetypes.guess_type(ragflow_doc.name)
+            mime_type = guess_mime_type(ragflow_doc.name)
 
             # Create document record
             new_doc = Document(
                 scope_id=scope_id,
                 filename=unique_filename,
                 original_name=ragflow_doc.name,
-                file_size=len(file_bytes),
+                file_size=file_size,
                 mime_type=mime_type,
                 file_extension=file_ext,
                 storage_path=storage_path,
@@ -479,11 +493,13 @@ async def sync_from_ragflow(
             imported_docs.append(doc_info)
 
             logger.info(
-                f"Imported document from RAGFlow: {ragflow_doc.name} -> {storage_path}"
+                "Imported document from RAGFlow: {} -> {}",
+                ragflow_doc.name,
+                storage_path,
             )
 
         except Exception as e:
-            logger.error(f"Failed to import document {ragflow_doc.name}: {e}")
+            logger.error("Failed to import document {}: {}", ragflow_doc.name, e)
             failed += 1
 
     if not dry_run:
@@ -1,6 +1,5 @@
 """Scope API routes."""
 
-from typing import cast
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -75,7 +74,7 @@ async def list_scopes(
         total_size = await db.scalar(total_size_query) or 0
 
         scope_item = ScopeListItem(
-            id=cast(UUID, scope.id),
+            id=scope.id,
             name=scope.name,
             description=scope.description,
             allowed_extensions=scope.allowed_extensions,
@@ -149,7 +148,7 @@ async def get_scope(
     )
 
     response = ScopeResponse(
-        id=cast(UUID, scope.id),
+        id=scope.id,
         name=scope.name,
         description=scope.description,
         allowed_extensions=scope.allowed_extensions,
@@ -198,7 +197,7 @@ async def create_scope(
     await db.refresh(scope)
 
     return ScopeResponse(
-        id=cast(UUID, scope.id),
+        id=scope.id,
         name=scope.name,
         description=scope.description,
         allowed_extensions=scope.allowed_extensions,
@@ -289,7 +288,7 @@ async def update_scope(
     await db.refresh(scope)
 
     return ScopeResponse(
-        id=cast(UUID, scope.id),
+        id=scope.id,
         name=scope.name,
         description=scope.description,
         allowed_extensions=scope.allowed_extensions,
@@ -324,10 +323,10 @@ async def delete_scope(
     for document in scope.documents:
         try:
             await storage.delete_file(document.storage_path)
-            logger.info(f"Deleted file from storage: {document.storage_path}")
+            logger.info("Deleted file from storage: {}", document.storage_path)
         except Exception as e:
             # Log error but continue with deletion
-            logger.warning(f"Failed to delete file {document.storage_path}: {e}")
+            logger.warning("Failed to delete file {}: {}", document.storage_path, e)
 
     # Delete scope (cascade will delete related documents and tags from database)
     await db.delete(scope)
@@ -1,9 +1,22 @@
 """Tag API routes."""
 
+from typing import Any, AsyncIterator, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select, and_
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    delete,
+    func,
+    literal,
+    bindparam,
+    lambda_stmt,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -17,13 +30,71 @@ from kbrain_backend.core.models.scope import Scope
 from kbrain_backend.core.models.tag import Tag
 from kbrain_backend.core.models.document import Document
 from kbrain_backend.database.connection import get_db
+from kbrain_backend.utils.http import (
+    ORJSONResponse,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
 
 router = APIRouter(prefix="/scopes/{scope_id}/tags", tags=["tags"])
 
+# Hot read statements are built once; SQLAlchemy caches their compiled form
+# and only the bound parameters change between requests
+LIST_TAGS = lambda_stmt(
+    lambda: select(Tag).where(Tag.scope_id == bindparam("scope_id")).order_by(Tag.name)
+)
+GET_TAG = lambda_stmt(
+    lambda: select(Tag).where(
+        Tag.id == bindparam("tag_id"), Tag.scope_id == bindparam("scope_id")
+    )
+)
+GET_DOCUMENT_WITH_TAGS = lambda_stmt(
+    lambda: (
+        select(Document)
+        .options(selectinload(Document.tags))
+        .where(Document.id == bindparam("document_id"))
+    )
+)
+
+# Tag endpoints return pre-serialized ORJSONResponse bodies; response_model is
+# kept on the routes for the OpenAPI schema only
+
+# Number of tags serialized per chunk when streaming tag lists
+TAG_STREAM_CHUNK_SIZE = 256
+
+
+def _tag_to_dict(tag: Tag) -> dict[str, Any]:
+    """Convert a Tag to a TagResponse-shaped dict for orjson serialization."""
+    return {
+        "name": tag.name,
+        "description": tag.description,
+        "color": tag.color,
+        "meta": tag.meta,
+        "id": tag.id,
+        "scope_id": tag.scope_id,
+        "created_at": tag.created_at,
+        "updated_at": tag.updated_at,
+    }
+
+
+def _duplicate_name_error(name: Optional[str]) -> HTTPException:
+    """Build the 409 raised when a tag name is already taken in the scope."""
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail={
+            "error": {
+                "code": "DUPLICATE_RESOURCE",
+                "message": f"Tag with name '{name}' already exists in this scope",
+            }
+        },
+    )
+
 
 @router.get("", response_model=TagListResponse)
 async def list_tags(
     scope_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """List all tags for a specific scope."""
@@ -37,12 +108,32 @@ async def list_tags(
             detail={"error": {"code": "NOT_FOUND", "message": "Scope not found"}},
         )
 
-    # Get all tags for this scope
-    query = select(Tag).where(Tag.scope_id == scope_id).order_by(Tag.name)
-    result = await db.execute(query)
-    tags = result.scalars().all()
-
-    return TagListResponse(tags=[TagResponse.model_validate(tag) for tag in tags])
+    # Cheap aggregate identifies the current version of the tag list
+    version_query = select(func.count(), func.max(Tag.updated_at)).where(
+        Tag.scope_id == scope_id
+    )
+    tag_count, last_updated = (await db.execute(version_query)).one()
+    etag = make_etag(scope_id, tag_count, last_updated)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # Stream tags in partitions so only one chunk of ORM objects is alive at a time
+    result = await db.stream(LIST_TAGS, {"scope_id": scope_id})
+
+    async def serialize_tags() -> AsyncIterator[bytes]:
+        yield b'{"tags":['
+        first = True
+        async for partition in result.scalars().partitions(TAG_STREAM_CHUNK_SIZE):
+            chunk = orjson.dumps([_tag_to_dict(tag) for tag in partition])[1:-1]
+            if not first:
+                yield b","
+            yield chunk
+            first = False
+        yield b"]}"
+
+    return StreamingResponse(
+        serialize_tags(), media_type="application/json", headers={"ETag": etag}
+    )
 
 
 @router.post("", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
@@ -63,47 +154,49 @@ async def create_tag(
         )
 
     # Check if tag with same name exists in this scope
-    existing_query = select(Tag).where(
-        and_(Tag.scope_id == scope_id, Tag.name == tag_data.name)
+    existing_query = (
+        select(literal(1))
+        .where(Tag.scope_id == scope_id, Tag.name == tag_data.name)
+        .limit(1)
     )
     existing = await db.scalar(existing_query)
 
     if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail={
-                "error": {
-                    "code": "DUPLICATE_RESOURCE",
-                    "message": f"Tag with name '{tag_data.name}' already exists in this scope",
-                }
-            },
+        raise _duplicate_name_error(tag_data.name)
+
+    # Create new tag - RETURNING brings back the generated defaults, so no refresh
+    stmt = (
+        insert(Tag)
+        .values(
+            scope_id=scope_id,
+            name=tag_data.name,
+            description=tag_data.description,
+            color=tag_data.color,
+            meta=tag_data.meta,
         )
-
-    # Create new tag
-    tag = Tag(
-        scope_id=scope_id,
-        name=tag_data.name,
-        description=tag_data.description,
-        color=tag_data.color,
-        meta=tag_data.meta,
+        .returning(Tag)
     )
+    try:
+        result = await db.execute(stmt)
+        tag = result.scalar_one()
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request created the same name after the check above
+        await db.rollback()
+        raise _duplicate_name_error(tag_data.name)
 
-    db.add(tag)
-    await db.commit()
-    await db.refresh(tag)
-
-    return TagResponse.model_validate(tag)
+    return ORJSONResponse(_tag_to_dict(tag), status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/{tag_id}", response_model=TagResponse)
 async def get_tag(
     scope_id: UUID,
     tag_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific tag by ID."""
-    query = select(Tag).where(and_(Tag.id == tag_id, Tag.scope_id == scope_id))
-    result = await db.execute(query)
+    result = await db.execute(GET_TAG, {"tag_id": tag_id, "scope_id": scope_id})
     tag = result.scalar_one_or_none()
 
     if not tag:
@@ -112,7 +205,11 @@ async def get_tag(
             detail={"error": {"code": "NOT_FOUND", "message": "Tag not found"}},
         )
 
-    return TagResponse.model_validate(tag)
+    etag = make_etag(tag.id, tag.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    return ORJSONResponse(_tag_to_dict(tag), headers={"ETag": etag})
 
 
 @router.patch("/{tag_id}", response_model=TagResponse)
@@ -123,9 +220,36 @@ async def update_tag(
     db: AsyncSession = Depends(get_db),
 ):
     """Update an existing tag."""
-    query = select(Tag).where(and_(Tag.id == tag_id, Tag.scope_id == scope_id))
-    result = await db.execute(query)
-    tag = result.scalar_one_or_none()
+    changes = {
+        field: value
+        for field, value in (
+            ("name", tag_data.name),
+            ("description", tag_data.description),
+            ("color", tag_data.color),
+            ("meta", tag_data.meta),
+        )
+        if value is not None
+    }
+
+    if not changes:
+        # Nothing to update - just return the current tag
+        tag = await db.scalar(GET_TAG, {"tag_id": tag_id, "scope_id": scope_id})
+    else:
+        # Single UPDATE ... RETURNING round-trip; the unique constraint on
+        # (scope_id, name) guards against duplicate names
+        stmt = (
+            update(Tag)
+            .where(Tag.id == tag_id, Tag.scope_id == scope_id)
+            .values(**changes)
+            .returning(Tag)
+        )
+        try:
+            result = await db.execute(stmt)
+            tag = result.scalar_one_or_none()
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise _duplicate_name_error(tag_data.name)
 
     if not tag:
         raise HTTPException(
@@ -133,38 +257,7 @@ async def update_tag(
             detail={"error": {"code": "NOT_FOUND", "message": "Tag not found"}},
         )
 
-    # Update fields
-    if tag_data.name is not None:
-        # Check for duplicate name
-        existing_query = select(Tag).where(
-            and_(Tag.scope_id == scope_id, Tag.name == tag_data.name, Tag.id != tag_id)
-        )
-        existing = await db.scalar(existing_query)
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail={
-                    "error": {
-                        "code": "DUPLICATE_RESOURCE",
-                        "message": f"Tag with name '{tag_data.name}' already exists in this scope",
-                    }
-                },
-            )
-        tag.name = tag_data.name
-
-    if tag_data.description is not None:
-        tag.description = tag_data.description
-
-    if tag_data.color is not None:
-        tag.color = tag_data.color
-
-    if tag_data.meta is not None:
-        tag.meta = tag_data.meta
-
-    await db.commit()
-    await db.refresh(tag)
-
-    return TagResponse.model_validate(tag)
+    return ORJSONResponse(_tag_to_dict(tag))
 
 
 @router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -174,17 +267,20 @@ async def delete_tag(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a tag."""
-    query = select(Tag).where(and_(Tag.id == tag_id, Tag.scope_id == scope_id))
-    result = await db.execute(query)
-    tag = result.scalar_one_or_none()
+    # Single DELETE ... RETURNING round-trip; document_tags rows are removed
+    # by the ON DELETE CASCADE foreign key
+    stmt = (
+        delete(Tag).where(Tag.id == tag_id, Tag.scope_id == scope_id).returning(Tag.id)
+    )
+    result = await db.execute(stmt)
+    deleted_id = result.scalar_one_or_none()
 
-    if not tag:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": {"code": "NOT_FOUND", "message": "Tag not found"}},
         )
 
-    await db.delete(tag)
     await db.commit()
 
     return None
@@ -197,15 +293,11 @@ documents_router = APIRouter(prefix="/v1/documents", tags=["documents", "tags"])
 @documents_router.get("/{document_id}/tags", response_model=TagListResponse)
 async def get_document_tags(
     document_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """Get all tags assigned to a document."""
-    doc_query = (
-        select(Document)
-        .options(selectinload(Document.tags))
-        .where(Document.id == document_id)
-    )
-    result = await db.execute(doc_query)
+    result = await db.execute(GET_DOCUMENT_WITH_TAGS, {"document_id": document_id})
     document = result.scalar_one_or_none()
 
     if not document:
@@ -214,6 +306,14 @@ async def get_document_tags(
             detail={"error": {"code": "NOT_FOUND", "message": "Document not found"}},
         )
 
-    return TagListResponse(
-        tags=[TagResponse.model_validate(tag) for tag in document.tags]
+    etag = make_etag(
+        document_id,
+        *sorted((str(tag.id), str(tag.updated_at)) for tag in document.tags),
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    return ORJSONResponse(
+        {"tags": [_tag_to_dict(tag) for tag in document.tags]},
+        headers={"ETag": etag},
     )
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 # ============================================================================
@@ -228,6 +228,10 @@ class DocumentListResponse(BaseModel):
     pagination: PaginationResponse
 
 
+# Validates a whole page of ORM documents in one call
+DocumentList = TypeAdapter(List[DocumentResponse])
+
+
 class DocumentUploadResponse(BaseModel):
     """Schema for document upload response."""
 
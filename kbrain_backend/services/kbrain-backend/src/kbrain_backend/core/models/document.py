@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from uuid import uuid4
+import uuid
 
 from sqlalchemy import String, Text, BigInteger, Integer, ForeignKey, JSON
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
@@ -20,10 +20,10 @@ class Document(Base):
 
     __tablename__ = "documents"
 
-    id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid4
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    scope_id: Mapped[UUID] = mapped_column(
+    scope_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("scopes.id", ondelete="CASCADE"),
         nullable=False,
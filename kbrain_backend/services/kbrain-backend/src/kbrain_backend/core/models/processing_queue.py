@@ -1,5 +1,6 @@
 """Processing queue database model."""
 
+import uuid
 from datetime import datetime
 from typing import Optional
 
@@ -16,7 +17,7 @@ class ProcessingQueue(Base):
     __tablename__ = "processing_queue"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
-    document_id: Mapped[UUID] = mapped_column(
+    document_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
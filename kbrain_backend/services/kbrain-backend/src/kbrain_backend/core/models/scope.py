@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import List, TYPE_CHECKING
-from uuid import uuid4
+import uuid
 
 from sqlalchemy import String, Text, ARRAY, JSON
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
@@ -20,8 +20,8 @@ class Scope(Base):
 
     __tablename__ = "scopes"
 
-    id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid4
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     name: Mapped[str] = mapped_column(
         String(255), unique=True, nullable=False, index=True
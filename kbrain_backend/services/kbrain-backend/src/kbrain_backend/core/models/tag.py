@@ -4,9 +4,18 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from uuid import uuid4
+import uuid
 
-from sqlalchemy import String, Text, ForeignKey, JSON, Table, Column, UniqueConstraint
+from sqlalchemy import (
+    String,
+    Text,
+    ForeignKey,
+    JSON,
+    Table,
+    Column,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -34,6 +43,9 @@ document_tags = Table(
         primary_key=True,
     ),
     Column("created_at", TIMESTAMP(timezone=True), default=datetime.utcnow),
+    # Reverse lookups (documents of a tag) - the primary key only covers
+    # (document_id, tag_id)
+    Index("ix_document_tags_tag_document", "tag_id", "document_id", unique=True),
 )
 
 
@@ -42,10 +54,10 @@ class Tag(Base):
 
     __tablename__ = "tags"
 
-    id: Mapped[UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid4
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    scope_id: Mapped[UUID] = mapped_column(
+    scope_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("scopes.id", ondelete="CASCADE"),
         nullable=False,
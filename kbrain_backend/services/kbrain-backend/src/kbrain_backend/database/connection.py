@@ -1,6 +1,8 @@
 """Database connection management."""
 
+import asyncio
 from typing import AsyncGenerator
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
@@ -13,6 +15,10 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=settings.database_pool_min,
     max_overflow=settings.database_pool_max - settings.database_pool_min,
+    connect_args={
+        "prepared_statement_cache_size": settings.database_statement_cache_size,
+        "statement_cache_size": settings.database_statement_cache_size,
+    },
 )
 
 # Create async session factory
@@ -57,6 +63,30 @@ async def init_db() -> None:
     pass
 
 
+async def warm_up_pool() -> None:
+    """
+    Open the pool's minimum number of connections ahead of traffic.
+
+    Without this, the first concurrent requests after startup all pay for
+    connection setup at once.
+    """
+    size = settings.database_pool_min
+    if size <= 0:
+        return
+
+    all_open = asyncio.Barrier(size)
+
+    async def open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            # Hold the connection until every task has one, so each opens its own
+            await all_open.wait()
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(size):
+            tg.create_task(open_connection())
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
@@ -1,6 +1,7 @@
 """KBrain Backend API - Main application entry point."""
 
 import os
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -10,7 +11,8 @@ from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from kbrain_backend.config.settings import settings
-from kbrain_backend.database.connection import init_db, close_db
+from kbrain_backend.api.middleware import UploadSizeLimitMiddleware
+from kbrain_backend.database.connection import init_db, close_db, warm_up_pool
 from kbrain_backend.api.routes import (
     scopes,
     documents,
@@ -28,6 +30,7 @@ from kbrain_backend.utils.errors import (
     general_exception_handler,
     database_error_handler,
 )
+from kbrain_backend.utils.http import ORJSONResponse
 from kbrain_backend.utils.logger import logger
 from kbrain_processor_orchestrator.orchestrator import ProcessingOrchestrator
 from kbrain_processor_orchestrator.publisher import QueuePublisher
@@ -53,7 +56,30 @@ storage: BaseFileStorage
 
 if STORAGE_BACKEND == "local":
     storage = LocalFileStorage(root_path=STORAGE_ROOT)
-    logger.info(f"Using local file storage in '{STORAGE_ROOT}' directory")
+    logger.info("Using local file storage in '{}' directory", STORAGE_ROOT)
+elif STORAGE_BACKEND == "local_uring":
+    if sys.platform == "linux":
+        from kbrain_storage.uring import UringLocalFileStorage
+
+        try:
+            storage = UringLocalFileStorage(root_path=STORAGE_ROOT)
+            logger.info(
+                "Using io_uring local file storage in '{}' directory", STORAGE_ROOT
+            )
+        except ImportError:
+            storage = LocalFileStorage(root_path=STORAGE_ROOT)
+            logger.warning(
+                "async-fs is not installed (kbrain-storage[uring] extra), "
+                "falling back to local file storage in '{}' directory",
+                STORAGE_ROOT,
+            )
+    else:
+        storage = LocalFileStorage(root_path=STORAGE_ROOT)
+        logger.warning(
+            "io_uring is only available on Linux, "
+            "falling back to local file storage in '{}' directory",
+            STORAGE_ROOT,
+        )
 elif STORAGE_BACKEND == "s3":
     # TODO: Implement S3 initialization
     raise NotImplementedError("S3 storage not yet implemented")
@@ -69,17 +95,26 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager."""
     # Startup
     logger.info("Starting KBrain API...")
-    logger.info(f"Database URL: {settings.database_url}")
-    logger.info(f"Storage Backend: {STORAGE_BACKEND}")
+    logger.info("Database URL: {}", settings.database_url)
+    logger.info("Storage Backend: {}", STORAGE_BACKEND)
 
     # Initialize database
     try:
         await init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.exception(f"Failed to initialize database: {e}")
+        logger.exception("Failed to initialize database: {}", e)
         raise
 
+    # Warm up the connection pool; connections are opened lazily on failure
+    try:
+        await warm_up_pool()
+        logger.info(
+            "Database pool warmed up with {} connections", settings.database_pool_min
+        )
+    except Exception as e:
+        logger.warning("Failed to warm up database pool: {!r}", e)
+
     # Set storage for document routes
     set_storage(storage)
 
@@ -164,7 +199,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
             logger.info("RabbitMQ consumer worker started successfully")
 
         except Exception as e:
-            logger.exception(f"Failed to initialize processing: {e}")
+            logger.exception("Failed to initialize processing: {}", e)
             # Don't fail app startup if processing fails
             logger.warning("Continuing without document processing enabled")
 
@@ -188,6 +223,9 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     await close_db()
     logger.info("Database connections closed")
 
+    # Flush queued log messages
+    await logger.complete()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -195,11 +233,16 @@ app = FastAPI(
     version=settings.app_version,
     description="Knowledge Management System with Flexible Document Processing",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/v1/openapi.json",
 )
 
+# Reject oversized uploads before their body is read. Added before CORS so
+# CORS stays outermost and its headers reach the 413 response too.
+app.add_middleware(UploadSizeLimitMiddleware, max_file_size=settings.max_file_size)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -226,10 +269,15 @@ app.include_router(statistics.router, prefix="/api/v1")
 app.include_router(health.router, prefix="/api")  # Health endpoints under /api
 app.include_router(processing.router, prefix="/api")  # Processing endpoints
 
+# The event loop is chosen by the server, not by this module: uvicorn builds
+# the loop before importing the app, so start it with --loop uvloop (see
+# start_service.sh) or pass loop="uvloop" when running programmatically.
 # if __name__ == "__main__":
 #     uvicorn.run(
 #         app,
 #         host=settings.host,
 #         port=settings.port,
 #         log_level=settings.log_level.lower(),
+#         loop="uvloop",
+#         http="httptools",
 #     )
@@ -3,14 +3,22 @@
 from typing import Optional, List, Dict, Any
 import traceback
 
-from fastapi import Request, status
+import orjson
+from fastapi import Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from kbrain_backend.utils.http import ORJSONResponse
 from kbrain_backend.utils.logger import logger
 from kbrain_backend.config.settings import settings
 
+# Generic 500 bodies never change outside debug mode, so they are serialized
+# once at import instead of on every error
+_INTERNAL_ERROR = {"code": "INTERNAL_ERROR", "message": "An internal error occurred"}
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": _INTERNAL_ERROR})
+_DATABASE_ERROR = {"code": "DATABASE_ERROR", "message": "A database error occurred"}
+_DATABASE_ERROR_BODY = orjson.dumps({"error": _DATABASE_ERROR})
+
 
 class APIError(Exception):
     """Base API error."""
@@ -78,7 +86,7 @@ class StorageError(APIError):
         )
 
 
-async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+async def api_error_handler(request: Request, exc: APIError) -> ORJSONResponse:
     """Handle custom API errors."""
     error_response: Dict[str, Any] = {
         "error": {
@@ -90,7 +98,7 @@ async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
     if exc.details:
         error_response["error"]["details"] = exc.details
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response,
     )
@@ -98,7 +106,7 @@ async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
 
 async def validation_error_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle validation errors."""
     details = []
     for error in exc.errors():
@@ -118,63 +126,54 @@ async def validation_error_handler(
         }
     }
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response,
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle general exceptions."""
-    # Log the full exception with traceback
-    logger.exception(
-        f"Unhandled exception in {request.method} {request.url.path}: {exc}"
-    )
-
-    error_response: Dict[str, Any] = {
-        "error": {
-            "code": "INTERNAL_ERROR",
-            "message": "An internal error occurred",
-        }
-    }
-
+def _server_error_response(
+    error: Dict[str, str], body: bytes, exc: Exception
+) -> Response:
+    """Build a 500 response from a pre-serialized body, with details in debug mode."""
     # In development mode, include error details
     if settings.log_level.upper() == "DEBUG":
-        error_response["error"]["details"] = {
-            "exception": str(exc),
-            "type": type(exc).__name__,
-            "traceback": traceback.format_exc(),
-        }
+        return ORJSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "error": {
+                    **error,
+                    "details": {
+                        "exception": str(exc),
+                        "type": type(exc).__name__,
+                        "traceback": traceback.format_exc(),
+                    },
+                }
+            },
+        )
 
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response,
+        content=body,
+        media_type="application/json",
     )
 
 
-async def database_error_handler(
-    request: Request, exc: SQLAlchemyError
-) -> JSONResponse:
-    """Handle database errors."""
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
+    """Handle general exceptions."""
     # Log the full exception with traceback
-    logger.exception(f"Database error in {request.method} {request.url.path}: {exc}")
+    logger.exception(
+        "Unhandled exception in {} {}: {}", request.method, request.url.path, exc
+    )
 
-    error_response: Dict[str, Any] = {
-        "error": {
-            "code": "DATABASE_ERROR",
-            "message": "A database error occurred",
-        }
-    }
+    return _server_error_response(_INTERNAL_ERROR, _INTERNAL_ERROR_BODY, exc)
 
-    # In development mode, include error details
-    if settings.log_level.upper() == "DEBUG":
-        error_response["error"]["details"] = {
-            "exception": str(exc),
-            "type": type(exc).__name__,
-            "traceback": traceback.format_exc(),
-        }
 
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response,
+async def database_error_handler(request: Request, exc: SQLAlchemyError) -> Response:
+    """Handle database errors."""
+    # Log the full exception with traceback
+    logger.exception(
+        "Database error in {} {}: {}", request.method, request.url.path, exc
     )
+
+    return _server_error_response(_DATABASE_ERROR, _DATABASE_ERROR_BODY, exc)
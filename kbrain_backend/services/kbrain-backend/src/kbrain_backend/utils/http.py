@@ -0,0 +1,85 @@
+"""HTTP caching helpers and the orjson response class."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the given parts.
+
+    Args:
+        parts: Values identifying the resource version (ids, timestamps, counts)
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches the ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (
+        candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")
+    )
+
+
+def http_date(value: datetime) -> str:
+    """Format a datetime as an HTTP date (e.g. for Last-Modified)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified_since(request: Request, last_modified: datetime) -> bool:
+    """
+    Check whether the request's If-Modified-Since header covers last_modified.
+
+    The header is ignored when If-None-Match is present, as required by
+    RFC 9110.
+    """
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return int(last_modified.timestamp()) <= int(since.timestamp())
+
+
+def not_modified(etag: str, last_modified: Optional[str] = None) -> Response:
+    """Build an empty 304 Not Modified response carrying the validators."""
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson.
+
+    A local stand-in for FastAPI's ORJSONResponse, which newer FastAPI
+    releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -7,14 +7,25 @@ from kbrain_backend.config.settings import settings
 # Remove default handler
 logger.remove()
 
-# Add custom handler with format and level
+# Full backtraces with variable values and call-site locations are only
+# worth their cost while debugging
+_debug = settings.log_level.upper() == "DEBUG"
+
+_format = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | "
+if _debug:
+    _format += "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+_format += "<level>{message}</level>"
+
+# Add custom handler with format and level; enqueue=True hands records to a
+# background thread so logging never blocks the event loop on stdout writes
 logger.add(
     sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+    format=_format,
     level=settings.log_level.upper(),
     colorize=True,
-    backtrace=True,  # Enable full backtrace on exceptions
-    diagnose=True,  # Enable variable values in traceback (disable in production)
+    enqueue=True,
+    backtrace=_debug,  # Extend backtrace beyond the catch point
+    diagnose=_debug,  # Include variable values in traceback
 )
 
 # Export logger for use in other modules
@@ -0,0 +1,33 @@
+"""MIME type helpers."""
+
+import mimetypes
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+
+@lru_cache(maxsize=2048)
+def _mime_type_for_suffixes(suffixes: str) -> Optional[str]:
+    """Look up the MIME type for lowercase file suffixes such as ".tar.gz"."""
+    mime_type, _ = mimetypes.guess_type(f"file{suffixes}")
+    return mime_type
+
+
+def guess_mime_type(filename: str) -> Optional[str]:
+    """
+    Guess the MIME type of a file from its extension.
+
+    Lookups are cached on the full suffix (".tar.gz", not just ".gz"), so
+    compound extensions resolve as before and repeated uploads of the same
+    file types skip mimetypes' URL and suffix parsing.
+
+    Args:
+        filename: File name or path
+
+    Returns:
+        MIME type, or None if the extension is unknown
+    """
+    suffixes = "".join(Path(filename).suffixes).lower()
+    if not suffixes:
+        return None
+    return _mime_type_for_suffixes(suffixes)
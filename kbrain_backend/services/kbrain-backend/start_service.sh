@@ -25,4 +25,5 @@ echo "=========================================="
 echo "Starting FastAPI server..."
 echo "=========================================="
 cd /app
-uv run fastapi run services/kbrain-backend/src/kbrain_backend/main.py
\ No newline at end of file
+uv run uvicorn kbrain_backend.main:app --app-dir services/kbrain-backend/src \
+    --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
\ No newline at end of file